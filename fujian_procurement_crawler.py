@@ -14,13 +14,24 @@ Fujian Provincial Government Procurement Network Crawler
 """
 
 import time
-import json
+import random
+import asyncio
 import csv
+import logging
+import operator
 import os
 import re
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from logging.handlers import MemoryHandler
 from urllib.parse import urljoin, urlparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -28,55 +39,314 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver import ActionChains
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 from tqdm import tqdm
+try:
+    import orjson
+except ImportError:  # 未安装orjson时退回标准库json
+    import json
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _json_dumps(obj, indent=False):
+    """
+    序列化为UTF-8字节串，优先使用orjson（C实现，带缩进时尤其比标准库快）
+    
+    Args:
+        obj: 待序列化对象
+        indent (bool): 是否按2空格缩进
+        
+    Returns:
+        bytes: JSON字节串
+    """
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data):
+    """
+    解析JSON字节串，优先使用orjson
+    
+    Args:
+        data (bytes): JSON字节串
+        
+    Returns:
+        解析得到的对象
+    """
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+# 验证码通过后在浏览器中屏蔽的静态资源
+_BLOCKED_URL_PATTERNS = ('*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.ico',
+                         '*.woff', '*.woff2', '*.ttf', '*.otf')
+
+# 搜索结果字段，同时决定CSV列顺序
+_RESULT_FIELDS = ('district', 'procurement_method', 'procurement_unit', 'title',
+                  'detail_url', 'publish_time', 'crawl_time')
+# 按列顺序一次取出一条结果的全部字段（C实现，避免逐列字典查找）
+_RESULT_ROW = operator.itemgetter(*_RESULT_FIELDS)
+
+# 结果表格与分页控件；能用CSS选择器的不用XPath（Chromium的CSS匹配更快），
+# 按文本定位的"前往"按钮只能用XPath
+_CSS_TABLE_BODY = "table tbody"
+_CSS_ROWS = "table tbody tr"
+_CSS_NEXT = "button.btn-next"
+_CSS_PAGE_INPUT = "input[placeholder='页码']"
+_XPATH_GO = "//button[contains(text(), '前往')]"
+
+# 翻页、点击等导航后等待元素时的轮询间隔（秒），默认0.5秒对很快出现的元素偏长
+_NAV_POLL_INTERVAL = 0.15
+
+# 查询按钮：文本（或内部span）包含"查询"的button，或value包含"查询"的按钮型input
+_XPATH_SEARCH_BUTTON = (
+    "//button[contains(normalize-space(.), '查询')]"
+    " | //input[(@type='button' or @type='submit') and contains(@value, '查询')]"
+)
+
+# 列表行onclick中的详情页参数: articleDetail(type, id, planId, channel, source)
+_ONCLICK_RE = re.compile(r"articleDetail\('([^']+)','([^']+)','([^']+)','([^']+)','([^']+)'\)")
+
+# 详情页发布时间
+_TIME_RE = re.compile(r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})')
+
+# 详情页选择器：标题候选、正文容器（class含content/article/detail）、附件链接
+_TITLE_CSS = 'h1, h2, h3, h4'
+_CONTENT_CSS = 'div[class*="content"], div[class*="article"], div[class*="detail"]'
+_ATTACHMENT_SUFFIXES = ('.pdf', '.doc', '.docx')
+_ATTACHMENT_CSS = ', '.join(f'a[href$="{suffix}"]' for suffix in _ATTACHMENT_SUFFIXES)
+
+# 合同信息字段，合并为一个正则单次扫描全文；每个分支包在前瞻中，
+# 同一行出现多个字段时也能各自匹配到。字段值限长200字符：全文按节点换行，
+# 但单个节点的文本仍可能很长，不限长时每个字段都要扫到行尾，长页面退化为平方级
+_CONTRACT_RE = re.compile(
+    r'(?=合同编号[：:]\s*(?P<contract_number>[^\n\r]{1,200}))'
+    r'|(?=合同名称[：:]\s*(?P<contract_name>[^\n\r]{1,200}))'
+    r'|(?=项目编号[：:]\s*(?P<project_number>[^\n\r]{1,200}))'
+    r'|(?=采购人\(甲方\)[：:]\s*(?P<buyer>[^\n\r]{1,200}))'
+    r'|(?=供应商\(乙方\)[：:]\s*(?P<supplier>[^\n\r]{1,200}))'
+    r'|(?=合同金额[：:]\s*(?P<contract_amount>[^\n\r]{1,200}))'
+    r'|(?=履约期限[：:]\s*(?P<performance_period>[^\n\r]{1,200}))'
+)
+
+# 在浏览器内一次性读取结果表格的所有行，同时检查验证码错误提示；
+# 表格和提示都还没出现时返回null，供WebDriverWait轮询
+_ROWS_JS = """
+if (!document.body) return null;
+const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+for (let n = walker.nextNode(); n; n = walker.nextNode()) {
+    if (n.textContent.includes('请完成上方验证码操作') && n.parentElement.offsetParent !== null) {
+        return {captcha_error: true, rows: []};
+    }
+}
+const tbody = document.querySelector('table tbody');
+if (!tbody) return null;
+const rows = Array.from(tbody.querySelectorAll('tr')).map(tr => {
+    const td = tr.querySelectorAll('td');
+    const text = i => (td[i] ? td[i].innerText : '');
+    const titleCell = td[3];
+    const link = titleCell ? titleCell.querySelector('a') : null;
+    const clickable = titleCell ? titleCell.querySelector('[onclick]') : null;
+    const data = {};
+    if (titleCell) {
+        for (const attr of titleCell.attributes) {
+            if (attr.name.startsWith('data-')) data[attr.name] = attr.value;
+        }
+    }
+    return {
+        cells: td.length,
+        text: tr.innerText,
+        district: text(0),
+        method: text(1),
+        unit: text(2),
+        title: link ? link.innerText : text(3),
+        href: link ? link.href : '',
+        onclick: titleCell ? (titleCell.getAttribute('onclick') || (clickable ? clickable.getAttribute('onclick') : '')) : '',
+        data: data,
+        publish_time: text(4)
+    };
+});
+return {captcha_error: false, rows: rows};
+"""
+
+
+# 在浏览器内解析总页数：优先"共 N 页"文本，其次分页器最后一个页码
+_TOTAL_PAGES_JS = r"""
+const info = Array.from(document.querySelectorAll('span')).find(s => /共\s*\d+\s*页/.test(s.textContent));
+if (info) return parseInt(info.textContent.match(/共\s*(\d+)\s*页/)[1], 10);
+const pages = document.querySelectorAll('ul.el-pager li');
+if (pages.length) {
+    const last = pages[pages.length - 1].textContent.trim();
+    if (/^\d+$/.test(last)) return parseInt(last, 10);
+}
+return null;
+"""
+
+
+class RateLimiter:
+    """
+    线程安全的最小间隔限速器：距上次放行不足min_gap（附加随机抖动）时才等待，空闲时不额外休眠
+    """
+
+    def __init__(self, min_gap, jitter=0.0):
+        """
+        Args:
+            min_gap (float): 两次放行的最小间隔（秒）
+            jitter (float): 在最小间隔上附加的随机抖动上限（秒）
+        """
+        self.min_gap = min_gap
+        self.jitter = jitter
+        self.next_ok = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """
+        预约下一个放行时刻，不阻塞；同步和异步路径都据此等待，共用同一个时钟
+        
+        Returns:
+            float: 距放行还需等待的秒数
+        """
+        with self.lock:
+            now = time.monotonic()
+            delay = max(0.0, self.next_ok - now)
+            self.next_ok = now + delay + self.min_gap + random.uniform(0, self.jitter)
+            return delay
+
+    def wait(self):
+        """
+        阻塞直到允许发出下一个请求
+        """
+        time.sleep(self.reserve())
 
 
 class FujianProcurementCrawler:
-    def __init__(self, headless=False, max_pages=None):
+    def __init__(self, headless=False, max_pages=None, debug=False, output_dir=None, profile_dir=None):
         """
         初始化爬虫
         
         Args:
             headless (bool): 是否使用无头模式
             max_pages (int): 最大爬取页数，None表示爬取所有页面
+            debug (bool): 是否输出调试信息（会额外读取页面HTML，较慢）
+            output_dir (str): 输出目录，传入已有目录时在其基础上续爬，None表示新建
+            profile_dir (str): Chrome用户数据目录，跨运行复用以保留静态资源缓存（同一时间只能有
+                一个爬虫进程使用），None表示每次运行新建临时目录，关闭浏览器后删除
         """
         self.base_url = "https://zfcg.czt.fujian.gov.cn"
         self.search_url = "https://zfcg.czt.fujian.gov.cn/maincms-web/xmgg?titleType=xmgg"
         self.detail_url_pattern = "https://zfcg.czt.fujian.gov.cn/maincms-web/articleDetail"  # 详情页URL模式
         self.max_pages = max_pages
+        self.debug = debug
+        self.user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        self.headers = {'User-Agent': self.user_agent, 'Referer': self.search_url}
+        
+        # 复用连接池的HTTP会话，同一主机的请求保持长连接，避免重复TLS握手
         self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.detail_concurrency = 10  # 详情页并发请求数
+        self.detail_batch_size = 50  # 每批并发抓取的详情页数量，限制同时驻留内存的HTML
+        self.host_min_interval = 1.5  # 同一主机两次请求的最小间隔（秒），避免被封禁
+        self.host_interval_jitter = 0.5  # 在最小间隔上附加的随机抖动上限（秒）
+        # 异步请求失败后用requests会话重试的线程池，线程数与连接池规模匹配
+        self._retry_executor = ThreadPoolExecutor(max_workers=8)
+        # 每个主机一个限速器，异步抓取、失败重试和浏览器点击共用
+        self._host_limiters = {}
+        self._host_limiters_lock = threading.Lock()
         
         # 会话状态管理
         self.captcha_filled = False  # 验证码填写状态
         self.session_active = False  # 会话状态
         
-        # 设置Chrome选项
+        # 启用/禁用详情提取的开关（默认关闭）
+        self.extract_details_enabled = False
+        
+        # 创建输出目录
+        self.output_dir = output_dir or f"fujian_procurement_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._setup_logging()
+        
+        # 数据存储：记录逐条追加到JSONL，内存中只保留计数；续爬时沿用已有记录
+        results_path = os.path.join(self.output_dir, 'search_results.jsonl')
+        details_path = os.path.join(self.output_dir, 'detail_data.jsonl')
+        self._resumed_urls = set()  # 上次运行已保存的搜索结果链接，续爬时不再重复写入
+        self.results_count = 0
+        if os.path.exists(results_path):
+            for record in self._iter_jsonl(results_path):
+                self.results_count += 1
+                if record.get('detail_url'):
+                    self._resumed_urls.add(record['detail_url'])
+        # 已完成的详情页链接直接取自已保存的详情记录，续爬时跳过；
+        # 不单独记录链接文件，强制中断后不会出现链接已记下而详情未落盘的情况
+        self._seen = set()
+        self.details_count = 0
+        if os.path.exists(details_path):
+            for record in self._iter_jsonl(details_path):
+                self.details_count += 1
+                self._seen.add(record['url'])
+        self._results_fp = open(results_path, 'ab', buffering=1 << 20)
+        self._details_fp = open(details_path, 'ab', buffering=1 << 20)
+        self._csv_fp = None
+        self._csv_writer = None
+        
+        # 输出目录和续爬记录都就绪后再启动浏览器，前面出错时不会遗留Chrome进程和临时目录
         chrome_options = Options()
         if headless:
-            chrome_options.add_argument('--headless')
+            chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
         chrome_options.add_argument('--disable-gpu')
         chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        chrome_options.add_argument(f'--user-agent={self.user_agent}')
+        # 指定用户目录时复用已预热的缓存；默认每次运行独占一个临时目录，多个进程互不冲突
+        self._temp_profile = profile_dir is None
+        self.profile_dir = profile_dir or tempfile.mkdtemp(prefix='fujian_crawler_chrome_')
+        chrome_options.add_argument(f'--user-data-dir={self.profile_dir}')
+        # DOMContentLoaded后即返回，不等待图片等子资源
+        chrome_options.page_load_strategy = 'eager'
         
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = None
+        try:
+            self.driver = webdriver.Chrome(options=chrome_options)
+            # 限定页面加载和脚本执行时长，服务器卡住时不会无限阻塞
+            self.driver.set_page_load_timeout(15)
+            self.driver.set_script_timeout(10)
+        except Exception:
+            # 浏览器启动失败时关闭已启动的浏览器，释放临时用户目录、数据文件和日志
+            self.close()
+            raise
         self.wait = WebDriverWait(self.driver, 10)
+        self.nav_wait = WebDriverWait(self.driver, 10, poll_frequency=_NAV_POLL_INTERVAL)
         
+        print(f"输出目录: {self.output_dir}")
 
+    def _setup_logging(self):
+        """
+        爬取过程日志写入输出目录下的crawl.log，先在内存中缓冲再批量落盘；
+        控制台只输出警告及以上，进度由tqdm显示
+        """
+        file_handler = logging.FileHandler(os.path.join(self.output_dir, 'crawl.log'), encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.WARNING)
+        console_handler.setFormatter(logging.Formatter('%(message)s'))
         
-        # 数据存储
-        self.results = []
-        self.detail_data = []
-        # 启用/禁用详情提取的开关（默认关闭）
-        self.extract_details_enabled = False
-        
-        # 创建输出目录
-        self.output_dir = f"fujian_procurement_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        os.makedirs(self.output_dir, exist_ok=True)
-        
-        print(f"输出目录: {self.output_dir}")
+        self._log_handlers = [
+            MemoryHandler(capacity=1000, flushLevel=logging.WARNING, target=file_handler),
+            console_handler,
+            file_handler
+        ]
+        for handler in self._log_handlers[:2]:
+            logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG if self.debug else logging.INFO)
+        logger.propagate = False
 
     def check_captcha_status(self):
         """
@@ -139,36 +409,21 @@ class FujianProcurementCrawler:
             print("🔍 正在查找查询按钮...")
             search_button = None
             
-            # 尝试多种选择器，针对Element UI框架的按钮结构
-            selectors = [
-                "//button[contains(.//span, '查询')]",  # 查找包含span且span文本包含"查询"的button
-                "//button[.//span[text()='查询']]",     # 查找包含span且span文本等于"查询"的button
-                "//button[contains(@class, 'el-button') and contains(.//span, '查询')]",  # Element UI按钮
-                "//button[contains(text(), '查询')]",
-                "//button[contains(normalize-space(text()), '查询')]",
-                "//button[text()='查询 ']",
-                "//button[normalize-space(text())='查询']",
-                "//input[@type='button' and @value='查询']",
-                "//input[@type='submit' and contains(@value, '查询')]"
-            ]
-            
-            for i, selector in enumerate(selectors):
-                try:
-                    print(f"🔍 尝试选择器 {i+1}: {selector}")
-                    search_button = self.driver.find_element(By.XPATH, selector)
-                    print(f"✅ 找到查询按钮，使用选择器 {i+1}")
-                    break
-                except NoSuchElementException:
-                    print(f"❌ 选择器 {i+1} 未找到按钮")
-                    continue
+            # 单个XPath并集一次匹配所有候选写法（含Element UI按钮内的span）
+            try:
+                search_button = self.driver.find_element(By.XPATH, _XPATH_SEARCH_BUTTON)
+                print("✅ 找到查询按钮")
+            except NoSuchElementException:
+                pass
             
             if search_button is None:
-                print("❌ 所有选择器都未找到查询按钮，打印页面源码进行调试...")
-                # 打印按钮相关的HTML
-                buttons = self.driver.find_elements(By.TAG_NAME, "button")
-                print(f"页面上找到 {len(buttons)} 个按钮:")
-                for i, btn in enumerate(buttons):
-                    print(f"按钮 {i+1}: text='{btn.text}', innerHTML='{btn.get_attribute('innerHTML')}'")
+                print("❌ 未找到查询按钮")
+                if self.debug:
+                    # 打印按钮相关的HTML（每个按钮都要额外往返WebDriver）
+                    buttons = self.driver.find_elements(By.TAG_NAME, "button")
+                    print(f"页面上找到 {len(buttons)} 个按钮:")
+                    for i, btn in enumerate(buttons):
+                        print(f"按钮 {i+1}: text='{btn.text}', innerHTML='{btn.get_attribute('innerHTML')}'")
                 raise Exception("无法找到查询按钮")
             
             # 点击按钮
@@ -192,6 +447,12 @@ class FujianProcurementCrawler:
             self.captcha_filled = True
             self.session_active = True
             
+            # 验证通过后把浏览器Cookie同步到HTTP会话，供详情页请求复用
+            self.sync_session_cookies()
+            
+            # 验证码已不再需要看图，此后屏蔽图片和字体以减少传输量
+            self.block_static_assets()
+            
             print("✅ 验证码输入成功，继续执行...")
             return True
             
@@ -213,10 +474,12 @@ class FujianProcurementCrawler:
             print(f"搜索采购单位: {unit_name}")
             
             # 打开搜索页面
-            self.driver.get(self.search_url)
-            time.sleep(3)
+            try:
+                self.driver.get(self.search_url)
+            except TimeoutException:
+                self._stop_loading()
             
-            # 输入采购单位
+            # 输入采购单位（等待输入框出现即继续）
             unit_input = self.wait.until(
                 EC.presence_of_element_located((By.XPATH, "//input[@placeholder='请输入采购单位']"))
             )
@@ -230,34 +493,14 @@ class FujianProcurementCrawler:
             
             # 点击查询按钮 - 修复按钮定位
             try:
-                # 尝试多种定位方式
-                search_btn = None
-                
-                # 方式1：通过文本内容（包含空格）
                 try:
-                    search_btn = self.driver.find_element(By.XPATH, "//button[contains(text(), '查询')]")
-                except:
-                    pass
-                
-                # 方式2：通过更精确的文本匹配
-                if not search_btn:
-                    try:
-                        search_btn = self.driver.find_element(By.XPATH, "//button[normalize-space(text())='查询']")
-                    except:
-                        pass
-                
-                # 方式3：通过按钮类型和位置
-                if not search_btn:
-                    try:
-                        buttons = self.driver.find_elements(By.TAG_NAME, "button")
-                        for btn in buttons:
-                            if "查询" in btn.text:
-                                search_btn = btn
-                                break
-                    except:
-                        pass
+                    search_btn = self.driver.find_element(By.XPATH, _XPATH_SEARCH_BUTTON)
+                except NoSuchElementException:
+                    search_btn = None
                 
                 if search_btn:
+                    # 验证码步骤已点击过一次查询，记下旧结果行以便等待本次查询刷新表格
+                    old_row = self._first_result_row()
                     search_btn.click()
                     print("成功点击查询按钮")
                 else:
@@ -268,11 +511,16 @@ class FujianProcurementCrawler:
                 print(f"点击查询按钮失败: {e}")
                 return False
             
-            # 等待搜索结果加载
-            time.sleep(5)
-            
             # 检查是否有搜索结果
             try:
+                # 先等旧结果行失效，否则上一次查询留下的行会让下面的等待立即返回
+                self._wait_for_table_refresh(old_row)
+                # 等待结果行或验证码提示出现，页面就绪即返回
+                self.wait.until(EC.any_of(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _CSS_ROWS)),
+                    EC.text_to_be_present_in_element((By.TAG_NAME, "body"), "请完成上方验证码操作")
+                ))
+                
                 # 检查页面是否显示"请完成上方验证码操作"
                 if "请完成上方验证码操作" in self.driver.page_source:
                     print("❌ 验证码验证失败，页面仍显示验证码提示")
@@ -280,7 +528,7 @@ class FujianProcurementCrawler:
                 
                 # 检查是否有搜索结果表格
                 result_table = self.wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//table//tbody//tr"))
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _CSS_ROWS))
                 )
                 print("✅ 搜索成功，找到结果表格")
                 return True
@@ -301,268 +549,183 @@ class FujianProcurementCrawler:
             list: 搜索结果列表
         """
         results = []
+        pending_clicks = []  # 需要点击才能获取链接的行: (行号, 结果项)
+        skipped = 0  # 本页被跳过的行数；逐行原因只记入日志文件，整页汇总一次警告
+        crawl_time = datetime.now().isoformat()  # 同一页结果共用一个爬取时间
         
         try:
-            # 首先检查是否有验证码错误提示
+            # 等待表格加载并一次execute_script取回整张表（连同验证码错误检查），
+            # 表格已就绪时只需一次WebDriver往返
             try:
-                captcha_error = self.driver.find_element(By.XPATH, "//*[contains(text(), '请完成上方验证码操作')]")
-                if captcha_error.is_displayed():
-                    print("❌ 检测到验证码错误：请完成上方验证码操作")
-                    print("请在浏览器中重新输入验证码并点击查询按钮")
-                    return []
-            except NoSuchElementException:
-                pass  # 没有验证码错误，继续执行
-            
-            # 等待表格加载
-            try:
-                table = self.wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//table//tbody"))
-                )
+                table = self.nav_wait.until(lambda d: d.execute_script(_ROWS_JS))
             except TimeoutException:
-                print("未找到搜索结果表格，可能需要重新搜索")
+                logger.warning("未找到搜索结果表格，可能需要重新搜索")
                 return []
             
-            # 提取表格行
-            rows = table.find_elements(By.TAG_NAME, "tr")
+            if table['captcha_error']:
+                logger.warning("❌ 检测到验证码错误：请完成上方验证码操作，请在浏览器中重新输入验证码并点击查询按钮")
+                return []
+            
+            rows = table['rows']
             
             if not rows:
-                print("表格中没有数据行")
+                logger.warning("表格中没有数据行")
                 return []
             
             # 检查是否只有表头没有数据
             if len(rows) == 1:
                 # 检查第一行是否包含表头信息
-                first_row_text = rows[0].text.strip()
+                first_row_text = rows[0]['text'].strip()
                 if any(header in first_row_text for header in ['区划', '采购方式', '采购单位', '公告标题', '发布时间']):
-                    print("⚠️  表格只有表头，没有实际数据。可能的原因：")
-                    print("   1. 验证码未正确输入")
-                    print("   2. 搜索条件没有匹配的结果")
-                    print("   3. 页面加载不完整")
+                    logger.warning("⚠️  表格只有表头，没有实际数据。可能的原因：\n"
+                                   "   1. 验证码未正确输入\n"
+                                   "   2. 搜索条件没有匹配的结果\n"
+                                   "   3. 页面加载不完整")
                     return []
             
-            print(f"找到 {len(rows)} 条搜索结果")
+            logger.info(f"找到 {len(rows)} 条搜索结果")
             
             for i, row in enumerate(rows, 1):
-                try:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    if len(cells) >= 5:
-                        # 提取基本信息
-                        district = cells[0].text.strip()
-                        procurement_method = cells[1].text.strip()
-                        procurement_unit = cells[2].text.strip()
-                        
-                        # 提取公告标题和链接
-                        title_cell = cells[3]
-                        title_link = None
-                        title = ""
-                        detail_url = ""
-                        
-                        # 方法1: 查找 <a> 标签
-                        try:
-                            title_link = title_cell.find_element(By.TAG_NAME, "a")
-                            title = title_link.text.strip()
-                            detail_url = title_link.get_attribute('href')
-                            print(f"✅ 第{i}行找到链接: {title[:30]}...")
-                        except NoSuchElementException:
-                            # 方法2-6: 其它方式构建链接
-                            try:
-                                clickable_elements = title_cell.find_elements(By.XPATH, ".//*[@onclick or @href or contains(@class, 'link') or contains(@class, 'clickable')]")
-                                if clickable_elements:
-                                    element = clickable_elements[0]
-                                    title = element.text.strip()
-                                    detail_url = element.get_attribute('href') or element.get_attribute('onclick')
-                                    print(f"🔗 第{i}行找到可点击元素: {title[:30]}...")
-                                else:
-                                    # 方法3: 检查单元格是否本身可点击
-                                    onclick = title_cell.get_attribute('onclick')
-                                    if onclick:
-                                        title = title_cell.text.strip()
-                                        detail_url = self.extract_url_from_onclick(onclick)
-                                        print(f"📱 第{i}行单元格可点击: {title[:30]}...")
-                                    else:
-                                        # 方法4: 查找所有子元素，看是否有隐藏的链接
-                                        all_children = title_cell.find_elements(By.XPATH, ".//*")
-                                        cell_text = title_cell.text.strip()
-                                        
-                                        print(f"🔍 第{i}行详细分析:")
-                                        print(f"   - 单元格文本: {cell_text[:50]}...")
-                                        print(f"   - 子元素数量: {len(all_children)}")
-                                        print(f"   - 单元格HTML: {title_cell.get_attribute('outerHTML')[:200]}...")
-                                        
-                                        # 检查是否有data属性包含链接信息
-                                        for attr in ['data-url', 'data-href', 'data-link', 'data-id']:
-                                            attr_value = title_cell.get_attribute(attr)
-                                            if attr_value:
-                                                print(f"   - 找到属性 {attr}: {attr_value}")
-                                                title = cell_text
-                                                detail_url = attr_value
-                                                break
-                                        
-                                        # 方法5: 基于JavaScript事件构建链接
-                                        if not detail_url and cell_text:
-                                            # 尝试从onclick事件中提取参数
-                                            onclick_attr = title_cell.get_attribute('onclick')
-                                            if onclick_attr and 'articleDetail' in onclick_attr:
-                                                detail_url = self.extract_url_from_onclick(onclick_attr)
-                                                title = cell_text
-                                                print(f"🔧 第{i}行从onclick构建链接: {title[:30]}...")
-                                            
-                                            # 方法6: 检查是否有data-*属性可以构建链接
-                                            if not detail_url:
-                                                data_attrs = self.extract_data_attributes(title_cell)
-                                                if data_attrs:
-                                                    detail_url = self.build_detail_url_from_data_attrs(data_attrs)
-                                                    title = cell_text
-                                                    print(f"🏗️ 第{i}行从data属性构建链接: {title[:30]}...")
-                                        
-                                        if not detail_url and cell_text:
-                                            print(f"⚠️  第{i}行标题列有内容但无链接: {cell_text[:30]}... 尝试点击打开详情")
-                                            try:
-                                                # 滚动到该单元格并尝试点击
-                                                self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", title_cell)
-                                                orig_url = self.driver.current_url
-                                                orig_handles = self.driver.window_handles
-                                                try:
-                                                    title_cell.click()
-                                                except Exception:
-                                                    ActionChains(self.driver).move_to_element(title_cell).click().perform()
-                                                
-                                                # 等待新窗口或URL变化
-                                                new_handle = None
-                                                try:
-                                                    WebDriverWait(self.driver, 5).until(lambda d: len(d.window_handles) > len(orig_handles))
-                                                    new_handle = [h for h in self.driver.window_handles if h not in orig_handles][0]
-                                                    self.driver.switch_to.window(new_handle)
-                                                except TimeoutException:
-                                                    WebDriverWait(self.driver, 8).until(lambda d: d.current_url != orig_url)
-                                                
-                                                detail_url = self.driver.current_url
-                                                title = cell_text
-                                                print(f"🧭 第{i}行点击后进入详情: {detail_url}")
-                                                
-                                                # 提取详情数据
-                                                detail_data = self.extract_detail_page(detail_url)
-                                                if detail_data:
-                                                    self.detail_data.append(detail_data)
-                                                
-                                                # 返回列表页
-                                                if new_handle:
-                                                    self.driver.close()
-                                                    self.driver.switch_to.window(orig_handles[0])
-                                                else:
-                                                    self.driver.back()
-                                                    self.wait.until(EC.presence_of_element_located((By.XPATH, "//table//tbody")))
-                                                time.sleep(1)
-                                                
-                                                # 构造结果项并加入列表
-                                                publish_time = cells[4].text.strip()
-                                                result = {
-                                                    'district': district,
-                                                    'procurement_method': procurement_method,
-                                                    'procurement_unit': procurement_unit,
-                                                    'title': title,
-                                                    'detail_url': detail_url,
-                                                    'publish_time': publish_time,
-                                                    'crawl_time': datetime.now().isoformat()
-                                                }
-                                                results.append(result)
-                                                print(f"✅ 通过点击提取第{i}行详情: {title[:50]}...")
-                                                
-                                            except Exception as click_err:
-                                                print(f"❌ 第{i}行点击打开详情失败: {click_err}")
-                                                continue
-                                        elif not cell_text:
-                                            print(f"❌ 第{i}行标题列为空")
-                                            continue
-                            except Exception as e:
-                                cell_text = title_cell.text.strip()
-                                if cell_text:
-                                    print(f"⚠️  第{i}行标题列有内容但无链接: {cell_text[:30]}...")
-                                else:
-                                    print(f"❌ 第{i}行标题列为空")
-                                continue
-                        
-                        # 验证提取的数据
-                        if not title or not detail_url:
-                            print(f"❌ 第{i}行标题或链接为空，跳过")
-                            continue
-                        
-                        publish_time = cells[4].text.strip()
-                        
-                        result = {
-                            'district': district,
-                            'procurement_method': procurement_method,
-                            'procurement_unit': procurement_unit,
-                            'title': title,
-                            'detail_url': detail_url,
-                            'publish_time': publish_time,
-                            'crawl_time': datetime.now().isoformat()
-                        }
-                        
-                        results.append(result)
-                        print(f"✅ 成功提取第{i}行: {title[:50]}...")
-                        
+                if row['cells'] < 5:
+                    logger.info(f"❌ 第{i}行列数不足({row['cells']}列)，跳过")
+                    skipped += 1
+                    continue
+                
+                title = row['title'].strip()
+                if not title:
+                    logger.info(f"❌ 第{i}行标题列为空，跳过")
+                    skipped += 1
+                    continue
+                
+                # 依次尝试: <a>链接 -> onclick参数 -> data-*属性
+                detail_url = row['href']
+                if not detail_url and row['onclick'] and 'articleDetail' in row['onclick']:
+                    detail_url = self.extract_url_from_onclick(row['onclick'])
+                if not detail_url:
+                    data_attrs = row['data']
+                    for attr in ['data-url', 'data-href', 'data-link']:
+                        if data_attrs.get(attr):
+                            detail_url = data_attrs[attr]
+                            break
                     else:
-                        print(f"❌ 第{i}行列数不足({len(cells)}列)，跳过")
-                        
-                except Exception as e:
-                    print(f"❌ 处理第{i}行时出错: {e}")
+                        detail_url = self.build_detail_url_from_data_attrs(
+                            {name.replace('data-', '', 1): value for name, value in data_attrs.items()}
+                        )
+                
+                result = {
+                    'district': row['district'].strip(),
+                    'procurement_method': row['method'].strip(),
+                    'procurement_unit': row['unit'].strip(),
+                    'title': title,
+                    'detail_url': detail_url or '',
+                    'publish_time': row['publish_time'].strip(),
+                    'crawl_time': crawl_time
+                }
+                
+                if not detail_url:
+                    # 点击会导航离开列表页，推迟到整页读取完成后处理
+                    logger.info(f"⚠️  第{i}行标题列有内容但无链接: {title[:30]}... 稍后尝试点击打开详情")
+                    if self.debug:
+                        logger.debug(f"   - onclick: {row['onclick']}")
+                        logger.debug(f"   - data属性: {row['data']}")
+                    pending_clicks.append((i, result))
                     continue
+                
+                results.append(result)
+                logger.info(f"✅ 成功提取第{i}行: {title[:50]}...")
+            
+            # 所有行读取完毕后再逐个点击无链接的行
+            for i, result in pending_clicks:
+                detail_url = self.resolve_detail_url_by_click(i)
+                if detail_url:
+                    result['detail_url'] = detail_url
+                    results.append(result)
+                    logger.info(f"✅ 通过点击提取第{i}行: {result['title'][:50]}...")
+                else:
+                    skipped += 1
+            
+            if skipped:
+                logger.warning(f"⚠️  本页 {len(rows)} 行中有 {skipped} 行被跳过（列数不足、标题为空或无法取得链接），详见crawl.log")
             
             if results:
-                print(f"✅ 成功提取 {len(results)} 条搜索结果")
+                logger.info(f"✅ 成功提取 {len(results)} 条搜索结果")
             else:
-                print("⚠️  未提取到任何有效的搜索结果")
-                print("建议检查：")
-                print("   1. 验证码是否正确输入")
-                print("   2. 搜索条件是否合适")
-                print("   3. 网络连接是否正常")
+                logger.warning("⚠️  未提取到任何有效的搜索结果，建议检查：\n"
+                               "   1. 验证码是否正确输入\n"
+                               "   2. 搜索条件是否合适\n"
+                               "   3. 网络连接是否正常")
                     
         except Exception as e:
-            print(f"❌ 提取搜索结果失败: {e}")
+            logger.error(f"❌ 提取搜索结果失败: {e}")
             
         return results
     
-    def extract_url_from_onclick(self, onclick_attr):
+    def resolve_detail_url_by_click(self, row_index):
         """
-        从onclick属性中提取URL
+        点击列表中第row_index行的标题单元格，获取详情页URL后返回列表页
         
         Args:
-            onclick_attr (str): onclick属性值
+            row_index (int): 行号（从1开始）
             
         Returns:
-            str: 构建的详情页URL
+            str: 详情页URL，失败时返回None
         """
         try:
-            if 'articleDetail' in onclick_attr:
-                # 解析onclick中的参数
-                match = re.search(r"articleDetail\('([^']+)','([^']+)','([^']+)','([^']+)','([^']+)'\)", onclick_attr)
-                if match:
-                    type_param, id_param, plan_id, channel, source = match.groups()
-                    return f"{self.detail_url_pattern}?type={type_param}&id={id_param}&planId={plan_id}&channel={channel}&soure={source}"
+            # 列表页可能已重新渲染，每次重新定位单元格
+            title_cell = self.wait.until(
+                EC.presence_of_element_located((By.XPATH, f"//table//tbody//tr[{row_index}]/td[4]"))
+            )
+            
+            # 滚动到该单元格并尝试点击
+            self.driver.execute_script("arguments[0].scrollIntoView({block:'center'});", title_cell)
+            orig_url = self.driver.current_url
+            orig_handles = self.driver.window_handles
+            self._host_limiter(self.base_url).wait()
+            try:
+                title_cell.click()
+            except Exception:
+                ActionChains(self.driver).move_to_element(title_cell).click().perform()
+            
+            # 等待新窗口或URL变化
+            new_handle = None
+            try:
+                WebDriverWait(self.driver, 5, poll_frequency=_NAV_POLL_INTERVAL).until(lambda d: len(d.window_handles) > len(orig_handles))
+                new_handle = [h for h in self.driver.window_handles if h not in orig_handles][0]
+                self.driver.switch_to.window(new_handle)
+            except TimeoutException:
+                WebDriverWait(self.driver, 8, poll_frequency=_NAV_POLL_INTERVAL).until(lambda d: d.current_url != orig_url)
+            
+            detail_url = self.driver.current_url
+            logger.info(f"🧭 第{row_index}行点击后进入详情: {detail_url}")
+            
+            # 返回列表页
+            if new_handle:
+                self.driver.close()
+                self.driver.switch_to.window(orig_handles[0])
+            else:
+                self.driver.back()
+                self.nav_wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, _CSS_TABLE_BODY)))
+            
+            return detail_url
+            
         except Exception as e:
-            print(f"❌ 解析onclick失败: {e}")
-        return None
+            logger.info(f"❌ 第{row_index}行点击打开详情失败: {e}")
+            return None
     
-    def extract_data_attributes(self, element):
+    def extract_url_from_onclick(self, onclick_attr):
         """
-        提取元素的data属性
+        从onclick属性中提取URL
         
         Args:
-            element: WebElement
+            onclick_attr (str): onclick属性值
             
         Returns:
-            dict: data属性字典
+            str: 构建的详情页URL
         """
-        data_attrs = {}
-        try:
-            for attr in ['data-id', 'data-type', 'data-plan-id', 'data-channel']:
-                value = element.get_attribute(attr)
-                if value:
-                    data_attrs[attr.replace('data-', '')] = value
-        except Exception as e:
-            print(f"❌ 提取data属性失败: {e}")
-        return data_attrs
+        match = _ONCLICK_RE.search(onclick_attr or '')
+        if match:
+            return f"{self.detail_url_pattern}?type={match[1]}&id={match[2]}&planId={match[3]}&channel={match[4]}&soure={match[5]}"
+        return None
     
     def build_detail_url_from_data_attrs(self, data_attrs):
         """
@@ -584,28 +747,25 @@ class FujianProcurementCrawler:
                 params += "&soure=ggxx"  # 默认来源
                 return f"{self.detail_url_pattern}?{params}"
         except Exception as e:
-            print(f"❌ 构建URL失败: {e}")
+            logger.error(f"❌ 构建URL失败: {e}")
         return None
 
-    def extract_detail_page(self, detail_url):
+    def extract_detail_from_html(self, html, detail_url, crawl_time=None):
         """
-        提取详情页面内容
+        解析详情页面内容
         
         Args:
+            html (str): 详情页面HTML
             detail_url (str): 详情页面URL
+            crawl_time (str): 爬取时间，None表示使用当前时间
             
         Returns:
             dict: 详情页面数据
         """
         try:
-            print(f"正在提取详情页: {detail_url}")
-            
-            # 打开详情页
-            self.driver.get(detail_url)
-            time.sleep(3)
-            
-            # 获取页面HTML
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            tree = LexborHTMLParser(html)
+            # 脚本和样式不含正文，先移除，减少后续全文遍历和正则扫描的文本量
+            tree.strip_tags(['script', 'style', 'noscript'])
             
             # 提取基本信息
             detail_data = {
@@ -615,57 +775,211 @@ class FujianProcurementCrawler:
                 'content': '',
                 'contract_info': {},
                 'attachments': [],
-                'crawl_time': datetime.now().isoformat()
+                'crawl_time': crawl_time or datetime.now().isoformat()
             }
             
             # 提取标题
-            title_elements = soup.find_all(['h1', 'h2', 'h3', 'h4'], string=re.compile(r'.*公告.*'))
-            if title_elements:
-                detail_data['title'] = title_elements[0].get_text().strip()
+            for heading in tree.css(_TITLE_CSS):
+                heading_text = heading.text(strip=True)
+                if '公告' in heading_text:
+                    detail_data['title'] = heading_text
+                    break
+            
+            # 全文只遍历一次，后续发布时间、正文兜底和合同信息共用；
+            # 按节点换行，避免表格单元格被拼成一整行
+            full_text = tree.body.text(separator='\n') if tree.body else ''
             
             # 提取发布时间
-            time_pattern = r'(\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2})'
-            time_match = re.search(time_pattern, soup.get_text())
+            time_match = _TIME_RE.search(full_text)
             if time_match:
                 detail_data['publish_time'] = time_match.group(1)
             
             # 提取正文内容
-            content_div = soup.find('div', class_=re.compile(r'content|article|detail'))
+            content_div = tree.css_first(_CONTENT_CSS)
             if content_div:
-                detail_data['content'] = content_div.get_text().strip()
+                detail_data['content'] = content_div.text(separator='\n').strip()
             else:
-                detail_data['content'] = soup.get_text().strip()
+                detail_data['content'] = full_text.strip()
             
             # 提取合同信息（如果是合同公告）
             if '合同' in detail_data.get('title', ''):
-                contract_info = self.extract_contract_info(soup)
+                contract_info = self.extract_contract_info(full_text)
                 detail_data['contract_info'] = contract_info
             
             # 提取附件链接
             attachments = []
-            for link in soup.find_all('a', href=True):
-                href = link.get('href')
-                if href and (href.endswith('.pdf') or href.endswith('.doc') or href.endswith('.docx')):
-                    if not href.startswith('http'):
-                        href = urljoin(self.base_url, href)
-                    attachments.append({
-                        'name': link.get_text().strip(),
-                        'url': href
-                    })
+            for link in tree.css(_ATTACHMENT_CSS):
+                href = link.attributes['href']
+                attachments.append({
+                    'name': link.text(strip=True),
+                    'url': href if href.startswith('http') else urljoin(self.base_url, href)
+                })
             detail_data['attachments'] = attachments
             
             return detail_data
             
         except Exception as e:
-            print(f"提取详情页失败: {e}")
+            logger.error(f"提取详情页失败: {e}")
             return None
 
-    def extract_contract_info(self, soup):
+    def _host_limiter(self, url):
+        """
+        获取URL所在主机的限速器，首次访问该主机时创建
+        
+        Args:
+            url (str): 请求URL
+            
+        Returns:
+            RateLimiter: 该主机共用的限速器
+        """
+        host = urlparse(url).netloc
+        with self._host_limiters_lock:
+            if host not in self._host_limiters:
+                self._host_limiters[host] = RateLimiter(self.host_min_interval, self.host_interval_jitter)
+            return self._host_limiters[host]
+
+    async def _wait_for_host(self, url):
+        """
+        按主机限速：距离该主机上次请求不足host_min_interval（附加随机抖动）时等待
+        
+        Args:
+            url (str): 请求URL
+        """
+        await asyncio.sleep(self._host_limiter(url).reserve())
+
+    async def _bounded_get(self, session, semaphore, url):
+        """
+        在并发限制和主机限速内异步获取单个详情页HTML
+        
+        Args:
+            session (aiohttp.ClientSession): 共享的HTTP会话
+            semaphore (asyncio.Semaphore): 并发控制信号量
+            url (str): 详情页面URL
+            
+        Returns:
+            str: 详情页面HTML，失败时返回None
+        """
+        async with semaphore:
+            await self._wait_for_host(url)
+            try:
+                logger.info(f"正在获取详情页: {url}")
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    html = await response.text()
+            except Exception as e:
+                # 异步请求失败时，用带重试的连接池会话再取一次
+                try:
+                    loop = asyncio.get_running_loop()
+                    html = await loop.run_in_executor(self._retry_executor, self._get_detail_html, url)
+                except Exception as retry_err:
+                    logger.error(f"获取详情页失败: {e}; 重试失败: {retry_err}")
+                    return None
+        
+        return html
+
+    def _get_detail_html(self, url):
+        """
+        通过连接池会话同步获取详情页HTML
+        
+        Args:
+            url (str): 详情页面URL
+            
+        Returns:
+            str: 详情页面HTML
+        """
+        self._host_limiter(url).wait()
+        response = self.session.get(url, timeout=10)
+        response.raise_for_status()
+        return response.text
+
+    def block_static_assets(self):
+        """
+        通过CDP屏蔽图片和字体请求；样式表保留，Element UI依赖它判断元素可见性
+        """
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(_BLOCKED_URL_PATTERNS)})
+        except Exception as e:
+            logger.error(f"屏蔽静态资源失败: {e}")
+
+    def sync_session_cookies(self):
+        """
+        将浏览器中的Cookie同步到HTTP会话
+        """
+        try:
+            self.session.cookies.update({c['name']: c['value'] for c in self.driver.get_cookies()})
+        except Exception as e:
+            logger.error(f"同步Cookie失败: {e}")
+
+    def _new_client_session(self):
+        """
+        创建异步HTTP会话，沿用已通过验证码的会话Cookie
+        
+        Returns:
+            aiohttp.ClientSession: 连接数不超过detail_concurrency的长连接会话
+        """
+        return aiohttp.ClientSession(
+            cookies=self.session.cookies.get_dict(),
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(total=15),
+            connector=aiohttp.TCPConnector(limit=self.detail_concurrency)
+        )
+
+    async def _fetch_batch(self, session, semaphore, urls):
+        """
+        先并发获取一批详情页的全部HTML，再逐个解析
+        
+        Args:
+            session (aiohttp.ClientSession): 共享的HTTP会话
+            semaphore (asyncio.Semaphore): 并发控制信号量
+            urls (list): 详情页面URL列表
+            
+        Returns:
+            list: 与urls一一对应的详情数据，失败项为None
+        """
+        htmls = await asyncio.gather(*(self._bounded_get(session, semaphore, url) for url in urls))
+        
+        crawl_time = datetime.now().isoformat()
+        return [self.extract_detail_from_html(html, url, crawl_time) if html else None
+                for url, html in zip(urls, htmls)]
+
+    async def _crawl_details(self, urls):
+        """
+        在同一个事件循环和HTTP会话中分批抓取并保存详情页，连接跨批次复用
+        
+        Args:
+            urls (list): 详情页面URL列表
+        """
+        semaphore = asyncio.Semaphore(self.detail_concurrency)
+        
+        async with self._new_client_session() as session:
+            with tqdm(total=len(urls), desc="详情进度", mininterval=1.0, disable=None) as pbar:
+                for start in range(0, len(urls), self.detail_batch_size):
+                    batch = urls[start:start + self.detail_batch_size]
+                    details = await self._fetch_batch(session, semaphore, batch)
+                    self.add_details([d for d in details if d])
+                    pbar.update(len(batch))
+
+    def crawl_details(self, urls):
+        """
+        抓取并保存详情页，只使用HTTP会话，不依赖浏览器
+        
+        Args:
+            urls (list): 详情页面URL列表
+        """
+        # 同一公告可能在多页重复出现，本次运行内按链接去重；已完成的跳过
+        pending = [url for url in dict.fromkeys(urls) if url not in self._seen]
+        if len(pending) < len(urls):
+            logger.info(f"跳过重复或已完成的详情页 {len(urls) - len(pending)} 个")
+        if pending:
+            asyncio.run(self._crawl_details(pending))
+
+    def extract_contract_info(self, text):
         """
         提取合同信息
         
         Args:
-            soup: BeautifulSoup对象
+            text (str): 详情页面全文
             
         Returns:
             dict: 合同信息
@@ -673,45 +987,14 @@ class FujianProcurementCrawler:
         contract_info = {}
         
         try:
-            text = soup.get_text()
-            
-            # 提取合同编号
-            contract_no_match = re.search(r'合同编号[：:]\s*([^\n\r]+)', text)
-            if contract_no_match:
-                contract_info['contract_number'] = contract_no_match.group(1).strip()
-            
-            # 提取合同名称
-            contract_name_match = re.search(r'合同名称[：:]\s*([^\n\r]+)', text)
-            if contract_name_match:
-                contract_info['contract_name'] = contract_name_match.group(1).strip()
-            
-            # 提取项目编号
-            project_no_match = re.search(r'项目编号[：:]\s*([^\n\r]+)', text)
-            if project_no_match:
-                contract_info['project_number'] = project_no_match.group(1).strip()
-            
-            # 提取采购人信息
-            buyer_match = re.search(r'采购人\(甲方\)[：:]\s*([^\n\r]+)', text)
-            if buyer_match:
-                contract_info['buyer'] = buyer_match.group(1).strip()
-            
-            # 提取供应商信息
-            supplier_match = re.search(r'供应商\(乙方\)[：:]\s*([^\n\r]+)', text)
-            if supplier_match:
-                contract_info['supplier'] = supplier_match.group(1).strip()
-            
-            # 提取合同金额
-            amount_match = re.search(r'合同金额[：:]\s*([^\n\r]+)', text)
-            if amount_match:
-                contract_info['contract_amount'] = amount_match.group(1).strip()
-            
-            # 提取履约期限
-            period_match = re.search(r'履约期限[：:]\s*([^\n\r]+)', text)
-            if period_match:
-                contract_info['performance_period'] = period_match.group(1).strip()
+            # 单次扫描提取所有字段，同名字段保留首次出现的值
+            for match in _CONTRACT_RE.finditer(text):
+                field = match.lastgroup
+                if field not in contract_info:
+                    contract_info[field] = match.group(field).strip()
             
         except Exception as e:
-            print(f"提取合同信息失败: {e}")
+            logger.error(f"提取合同信息失败: {e}")
             
         return contract_info
 
@@ -723,27 +1006,53 @@ class FujianProcurementCrawler:
             int: 总页数
         """
         try:
-            # 查找分页信息
-            page_info = self.driver.find_element(By.XPATH, "//span[contains(text(), '页')]")
-            page_text = page_info.text
-            
-            # 提取总页数
-            page_match = re.search(r'共\s*(\d+)\s*页', page_text)
-            if page_match:
-                return int(page_match.group(1))
-            
-            # 备用方法：查找最后一页的页码
-            page_numbers = self.driver.find_elements(By.XPATH, "//ul[@class='el-pager']//li")
-            if page_numbers:
-                last_page = page_numbers[-1].text
-                if last_page.isdigit():
-                    return int(last_page)
+            # 一次execute_script在页面内完成查找和解析
+            total = self.driver.execute_script(_TOTAL_PAGES_JS)
+            if total:
+                return int(total)
                     
         except Exception as e:
-            print(f"获取总页数失败: {e}")
+            logger.error(f"获取总页数失败: {e}")
             
         return 1
 
+    def _stop_loading(self):
+        """
+        driver.get加载超时时停止加载，已到达DOMContentLoaded的页面可以继续操作
+        """
+        try:
+            self.driver.execute_script('window.stop();')
+        except Exception as e:
+            logger.error(f"停止页面加载失败: {e}")
+
+    def _first_result_row(self):
+        """
+        获取当前结果表格的第一行，用于翻页后判断表格是否已刷新
+        
+        Returns:
+            WebElement: 第一行元素，没有数据行时返回None
+        """
+        try:
+            return self.driver.find_element(By.CSS_SELECTOR, _CSS_ROWS)
+        except NoSuchElementException:
+            return None
+
+    def _wait_for_table_refresh(self, old_row):
+        """
+        等待翻页前的旧行失效，表格一重建立即返回
+        
+        Args:
+            old_row (WebElement): 翻页前的第一行元素
+        """
+        if old_row is None:
+            return
+        try:
+            # 最多等待原先固定休眠的3秒
+            WebDriverWait(self.driver, 3, poll_frequency=_NAV_POLL_INTERVAL).until(EC.staleness_of(old_row))
+        except TimeoutException:
+            # 表格可能原地更新而没有重建行元素，短暂等待后继续
+            time.sleep(random.uniform(0.2, 0.4))
+
     def go_to_next_page(self):
         """
         跳转到下一页
@@ -753,24 +1062,30 @@ class FujianProcurementCrawler:
         """
         try:
             # 查找下一页按钮
-            next_btn = self.driver.find_element(By.XPATH, "//button[contains(@class, 'btn-next')]")
+            next_btn = self.driver.find_element(By.CSS_SELECTOR, _CSS_NEXT)
             
             if 'is-disabled' in next_btn.get_attribute('class'):
-                print("已到达最后一页")
+                logger.info("已到达最后一页")
                 return False
                 
+            old_row = self._first_result_row()
             next_btn.click()
-            time.sleep(3)
+            self._wait_for_table_refresh(old_row)
             
             # 等待新页面加载
-            self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//table//tbody//tr"))
-            )
+            try:
+                self.nav_wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _CSS_ROWS))
+                )
+            except TimeoutException:
+                # 翻页由XHR加载，window.stop()无济于事；结果未出现就停止翻页
+                logger.warning("⚠️  下一页结果加载超时，停止翻页")
+                return False
             
             return True
             
         except Exception as e:
-            print(f"跳转下一页失败: {e}")
+            logger.error(f"跳转下一页失败: {e}")
             return False
 
     def go_to_page(self, page_num):
@@ -784,68 +1099,199 @@ class FujianProcurementCrawler:
             bool: 是否跳转成功
         """
         try:
-            print(f"跳转到第 {page_num} 页")
+            logger.info(f"跳转到第 {page_num} 页")
             
             # 查找页码输入框
             page_input = self.wait.until(
-                EC.presence_of_element_located((By.XPATH, "//input[@placeholder='页码']"))
+                EC.presence_of_element_located((By.CSS_SELECTOR, _CSS_PAGE_INPUT))
             )
             page_input.clear()
             page_input.send_keys(str(page_num))
             
             # 点击前往按钮
-            go_btn = self.driver.find_element(By.XPATH, "//button[contains(text(), '前往')]")
+            go_btn = self.driver.find_element(By.XPATH, _XPATH_GO)
+            old_row = self._first_result_row()
             go_btn.click()
             
             # 等待页面加载
-            time.sleep(3)
+            self._wait_for_table_refresh(old_row)
             
             # 验证是否跳转成功
             try:
-                self.wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//table//tbody//tr"))
+                self.nav_wait.until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, _CSS_ROWS))
                 )
-                print(f"成功跳转到第 {page_num} 页")
+                logger.info(f"成功跳转到第 {page_num} 页")
                 return True
             except TimeoutException:
-                print(f"跳转到第 {page_num} 页失败")
+                logger.warning(f"⚠️  第 {page_num} 页结果加载超时，跳转失败")
                 return False
                 
         except Exception as e:
-            print(f"页面跳转失败: {e}")
+            logger.error(f"页面跳转失败: {e}")
             return False
 
+    def add_results(self, records):
+        """
+        追加搜索结果，逐条写入JSONL文件而不在内存中累积
+        
+        Args:
+            records (list): 搜索结果列表
+        """
+        # 续爬时跳过上次运行已保存过的结果；没有链接的结果无法判断是否重复，照常写入
+        if self._resumed_urls:
+            records = [r for r in records if not r.get('detail_url') or r['detail_url'] not in self._resumed_urls]
+        if not records:
+            return
+        
+        for record in records:
+            self._results_fp.write(_json_dumps(record) + b"\n")
+        
+        # CSV同样边爬边写，首次有数据时打开文件，新文件先写表头
+        if self._csv_writer is None:
+            self._csv_fp = open(os.path.join(self.output_dir, 'search_results.csv'), 'a',
+                                newline='', encoding='utf-8-sig', buffering=1 << 20)
+            self._csv_writer = csv.writer(self._csv_fp)
+            if self._csv_fp.tell() == 0:
+                self._csv_writer.writerow(_RESULT_FIELDS)
+        self._csv_writer.writerows(map(_RESULT_ROW, records))
+        
+        self.results_count += len(records)
+
+    def add_details(self, records):
+        """
+        追加详情数据，逐条写入JSONL文件而不在内存中累积
+        
+        Args:
+            records (list): 详情数据列表
+        """
+        for record in records:
+            self._details_fp.write(_json_dumps(record) + b"\n")
+            self._seen.add(record['url'])
+        self.details_count += len(records)
+
+    def _iter_jsonl(self, path):
+        """
+        逐行读取JSONL文件；上次运行被强制中断时末行可能只写了一半，
+        读完后截掉该行，避免续写的记录与它拼在同一行
+        
+        Args:
+            path (str): JSONL文件路径
+            
+        Yields:
+            dict: 每行对应的记录
+        """
+        torn_at = None
+        offset = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    try:
+                        record = _json_loads(line)
+                    except ValueError:
+                        # 只有缺少换行的末行才是写入被中断，其他位置的损坏照常报错
+                        if line.endswith(b'\n'):
+                            raise
+                        torn_at = offset
+                        break
+                    yield record
+                offset += len(line)
+            else:
+                # 末行完整但缺少换行时补上
+                needs_newline = offset > 0 and not line.endswith(b'\n')
+        
+        if torn_at is not None:
+            logger.warning(f"⚠️  {path} 末行不完整（上次运行被中断），已截断")
+            with open(path, 'r+b') as f:
+                f.truncate(torn_at)
+        elif needs_newline:
+            with open(path, 'ab') as f:
+                f.write(b"\n")
+
+    def _jsonl_to_json(self, jsonl_path, json_path):
+        """
+        流式地将JSONL文件转换为带缩进的JSON数组文件
+        
+        Args:
+            jsonl_path (str): JSONL文件路径
+            json_path (str): 输出JSON文件路径
+        """
+        with open(json_path, 'wb') as f:
+            separator = b'[\n  '
+            for record in self._iter_jsonl(jsonl_path):
+                f.write(separator + _json_dumps(record, indent=True).replace(b'\n', b'\n  '))
+                separator = b',\n  '
+            f.write(b'[]' if separator == b'[\n  ' else b'\n]')
+
     def save_data(self):
         """
-        保存数据到文件
+        保存数据到文件，由JSONL流式生成JSON（CSV已在爬取过程中写入）
         """
         try:
+            self._results_fp.flush()
+            self._details_fp.flush()
+            if self._csv_fp:
+                self._csv_fp.flush()
+            
             # 保存搜索结果为JSON
             results_file = os.path.join(self.output_dir, 'search_results.json')
-            with open(results_file, 'w', encoding='utf-8') as f:
-                json.dump(self.results, f, ensure_ascii=False, indent=2)
-            
-            # 保存搜索结果为CSV
-            if self.results:
-                csv_file = os.path.join(self.output_dir, 'search_results.csv')
-                with open(csv_file, 'w', newline='', encoding='utf-8-sig') as f:
-                    writer = csv.DictWriter(f, fieldnames=self.results[0].keys())
-                    writer.writeheader()
-                    writer.writerows(self.results)
+            self._jsonl_to_json(self._results_fp.name, results_file)
             
             # 保存详情数据为JSON（仅在启用详情提取时）
-            if self.extract_details_enabled and self.detail_data:
+            if self.extract_details_enabled and self.details_count:
                 detail_file = os.path.join(self.output_dir, 'detail_data.json')
-                with open(detail_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.detail_data, f, ensure_ascii=False, indent=2)
+                self._jsonl_to_json(self._details_fp.name, detail_file)
             
-            print(f"数据已保存到: {self.output_dir}")
-            print(f"搜索结果: {len(self.results)} 条")
+            logger.info(f"数据已保存到: {self.output_dir}")
+            logger.info(f"搜索结果: {self.results_count} 条")
             if self.extract_details_enabled:
-                print(f"详情数据: {len(self.detail_data)} 条")
+                logger.info(f"详情数据: {self.details_count} 条")
             
         except Exception as e:
-            print(f"保存数据失败: {e}")
+            logger.error(f"保存数据失败: {e}")
+
+    def _crawl_list_pages_browser(self):
+        """
+        在浏览器中逐页提取搜索结果
+        
+        Returns:
+            list: 待抓取的详情页链接
+        """
+        # 获取总页数
+        total_pages = self.get_total_pages()
+        logger.info(f"总页数: {total_pages}")
+        
+        if self.max_pages:
+            total_pages = min(total_pages, self.max_pages)
+            logger.info(f"限制爬取页数: {total_pages}")
+        
+        # 逐页提取数据
+        current_page = 1
+        detail_urls = []
+        
+        with tqdm(total=total_pages, desc="爬取进度", mininterval=1.0, disable=None) as pbar:
+            while current_page <= total_pages:
+                logger.info(f"正在处理第 {current_page} 页...")
+                
+                # 提取当前页搜索结果
+                page_results = self.extract_search_results()
+                self.add_results(page_results)
+                
+                logger.info(f"第 {current_page} 页提取到 {len(page_results)} 条记录")
+                
+                # 详情页链接先收集，列表页全部完成后再统一抓取
+                if self.extract_details_enabled:
+                    detail_urls.extend(r['detail_url'] for r in page_results if r.get('detail_url'))
+                
+                # 跳转到下一页
+                if current_page < total_pages:
+                    if not self.go_to_next_page():
+                        break
+                
+                current_page += 1
+                pbar.update(1)
+        
+        return detail_urls
 
     def run(self, unit_name="医院", extract_details=False):
         """
@@ -856,68 +1302,37 @@ class FujianProcurementCrawler:
             extract_details (bool): 是否提取详情页面
         """
         try:
-            print("开始运行福建省政府采购网爬虫...")
+            logger.info("开始运行福建省政府采购网爬虫...")
             # 同步详情提取开关
             self.extract_details_enabled = extract_details
             
             # 搜索采购单位
             if not self.search_procurement_unit(unit_name):
-                print("搜索失败，程序退出")
+                logger.warning("搜索失败，程序退出")
                 return
             
-            # 获取总页数
-            total_pages = self.get_total_pages()
-            print(f"总页数: {total_pages}")
+            # 在浏览器中逐页提取搜索结果
+            detail_urls = self._crawl_list_pages_browser()
             
-            if self.max_pages:
-                total_pages = min(total_pages, self.max_pages)
-                print(f"限制爬取页数: {total_pages}")
+            # 列表页已全部收集，浏览器不再需要：同步最新Cookie后释放，
+            # 详情页只走HTTP，不必让Chrome进程在整个详情阶段占用内存
+            self.sync_session_cookies()
+            self.close_browser()
             
-            # 逐页提取数据
-            current_page = 1
-            
-            with tqdm(total=total_pages, desc="爬取进度") as pbar:
-                while current_page <= total_pages:
-                    print(f"\n正在处理第 {current_page} 页...")
-                    
-                    # 提取当前页搜索结果
-                    page_results = self.extract_search_results()
-                    self.results.extend(page_results)
-                    
-                    print(f"第 {current_page} 页提取到 {len(page_results)} 条记录")
-                    
-                    # 提取详情页面（可选）
-                    if self.extract_details_enabled:
-                        for result in page_results:
-                            if result.get('detail_url'):
-                                detail_data = self.extract_detail_page(result['detail_url'])
-                                if detail_data:
-                                    self.detail_data.append(detail_data)
-                                time.sleep(1)  # 避免请求过快
-                    
-                    # 跳转到下一页
-                    if current_page < total_pages:
-                        if not self.go_to_next_page():
-                            break
-                    
-                    current_page += 1
-                    pbar.update(1)
-                    
-                    # 定期保存数据
-                    if current_page % 10 == 0:
-                        self.save_data()
+            if detail_urls:
+                self.crawl_details(detail_urls)
             
             # 最终保存数据
             self.save_data()
             
-            print("\n爬取完成！")
+            logger.info("爬取完成！")
             
         except Exception as e:
-            print(f"运行出错: {e}")
+            logger.error(f"运行出错: {e}")
         finally:
             self.close()
 
-    def close(self):
+    def close_browser(self):
         """
         关闭浏览器
         """
@@ -925,6 +1340,24 @@ class FujianProcurementCrawler:
             self.driver.quit()
         except:
             pass
+        # Chrome退出后才能删除本次运行的临时用户目录
+        if self._temp_profile:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+    def close(self):
+        """
+        关闭浏览器和数据文件
+        """
+        self.close_browser()
+        self._retry_executor.shutdown(wait=False)
+        self._results_fp.close()
+        self._details_fp.close()
+        if self._csv_fp:
+            self._csv_fp.close()
+        # 先刷新内存缓冲再关闭日志文件
+        for handler in self._log_handlers:
+            logger.removeHandler(handler)
+            handler.close()
 
 
 def main():
@@ -944,8 +1377,13 @@ def main():
     
     headless = input("是否使用无头模式? (y/n, 默认: n): ").strip().lower() == 'y'
     
+    output_dir = input("续爬的输出目录 (默认: 新建): ").strip() or None
+    
+    profile_dir = input("复用的Chrome用户数据目录 (默认: 每次新建临时目录): ").strip() or None
+    
     # 创建爬虫实例
-    crawler = FujianProcurementCrawler(headless=headless, max_pages=max_pages)
+    crawler = FujianProcurementCrawler(headless=headless, max_pages=max_pages, output_dir=output_dir,
+                                       profile_dir=profile_dir)
     
     try:
         # 运行爬虫